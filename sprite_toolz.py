@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 import sys
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 from PIL import Image
 import imageio
@@ -9,20 +11,101 @@ from PyQt6.QtWidgets import (QApplication, QMainWindow, QLabel, QScrollArea,
                             QFileDialog, QSpinBox, QCheckBox, QColorDialog, 
                             QGridLayout, QGroupBox, QSlider, QFrame, QSizePolicy,
                             QMessageBox, QTabWidget, QRadioButton)
-from PyQt6.QtGui import QPixmap, QPainter, QPen, QColor, QImage, QCursor
-from PyQt6.QtCore import Qt, QRect, QSize, QPoint
+from PyQt6.QtGui import QPixmap, QPainter, QPen, QBrush, QColor, QImage, QCursor, QPixmapCache
+from PyQt6.QtCore import (Qt, QRect, QSize, QPoint, QLine, QObject, QRunnable,
+                          QThreadPool, QTimer, pyqtSignal)
+
+
+PNG_FAST_COMPRESS_LEVEL = 1  # zlib level used by "Fast PNG"; bigger files, much faster saves
+PNG_DEFAULT_COMPRESS_LEVEL = 6  # Pillow's default zlib level
+
+_batch_scratch = threading.local()  # Per-worker buffers reused across batch files
+
+
+def batch_scratch(name, shape):
+    """Return an uninitialized uint8 array backed by a grow-only buffer of this worker thread"""
+    size = int(np.prod(shape))
+    buf = getattr(_batch_scratch, name, None)
+    if buf is None or buf.size < size:
+        buf = np.empty(size, dtype=np.uint8)
+        setattr(_batch_scratch, name, buf)
+    return buf[:size].reshape(shape)
+
+
+def pad_cells(sheet, cell_width, cell_height, padding, scratch=None):
+    """Return a copy of the sheet with a transparent border of padding around every cell
+    
+    With scratch set, the result is built in that named batch_scratch buffer.
+    """
+    # Trim partial cells and view the sheet as a (rows, h, cols, w) grid
+    cols = sheet.shape[1] // cell_width
+    rows = sheet.shape[0] // cell_height
+    src = sheet[:rows * cell_height, :cols * cell_width]
+    channels = src.shape[2:]
+    cells = src.reshape((rows, cell_height, cols, cell_width) + channels)
+    
+    padded_shape = (rows, cell_height + 2 * padding, cols, cell_width + 2 * padding) + channels
+    if scratch is None:
+        padded = np.zeros(padded_shape, dtype=src.dtype)  # Transparent background
+    else:
+        # A reused buffer holds the last sheet, so blank only the gutters
+        padded = batch_scratch(scratch, padded_shape)
+        padded[:, :padding] = 0
+        padded[:, padding + cell_height:] = 0
+        padded[:, padding:padding + cell_height, :, :padding] = 0
+        padded[:, padding:padding + cell_height, :, padding + cell_width:] = 0
+    
+    # Copy every cell into its padded slot with a single strided assignment
+    padded[:, padding:padding + cell_height, :, padding:padding + cell_width] = cells
+    return padded.reshape(
+        (rows * (cell_height + 2 * padding), cols * (cell_width + 2 * padding)) + channels
+    )
+
+
+def palettize_frames(frames):
+    """Quantize an (N, h, w, 4) frame stack to one shared palette and return P-mode frames
+    
+    Saving RGBA frames as a GIF quantizes every frame on its own; one pass over the
+    stacked frames gives the same adaptive palette to all of them.
+    """
+    count, height, width = frames.shape[:3]
+    side_by_side = frames.swapaxes(0, 1)
+    if side_by_side.flags.c_contiguous:
+        # Tiles viewed out of one full row of a sheet already lie side by side
+        # in memory, so the strip is wrapped without copying
+        stack = Image.fromarray(side_by_side.reshape(height, count * width, 4))
+        boxes = [(i * width, 0, (i + 1) * width, height) for i in range(count)]
+    else:
+        stack = Image.fromarray(np.ascontiguousarray(frames).reshape(count * height, width, 4))
+        boxes = [(0, i * height, width, (i + 1) * height) for i in range(count)]
+    stack = stack.convert('P', palette=Image.Palette.ADAPTIVE)
+    
+    # Mark the fully transparent palette entry the way the GIF encoder would
+    if stack.palette.mode == 'RGBA':
+        for rgba, index in stack.palette.colors.items():
+            if rgba[3] == 0:
+                stack.info['transparency'] = index
+                break
+    return [stack.crop(box) for box in boxes]
 
 
 class SpriteCanvas(QLabel):
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.spritesheet = None
-        self.sprite_image = None
-        self.original_image = None  # Store the original image without padding
+        self.spritesheet = None  # RGBA pixel buffer, the source of truth for the sheet
+        self._sprite_image = None  # PIL view of spritesheet, built on demand
+        self._base_pixmap = None  # Unzoomed pixmap of the sprite image
+        self._pixmap_dirty = True  # Rebuild _base_pixmap on next update_pixmap
+        self._orig_arr = None  # Unpadded pixel buffer the padding preview is built from
         self.cell_width = 32
         self.cell_height = 32
         self.show_grid = True
         self.grid_color = QColor(255, 0, 0, 128)  # Semi-transparent red
+        self._grid_pen = QPen(self.grid_color, 1)
+        self._selection_brush = QBrush(QColor(0, 0, 255, 80))  # Semi-transparent blue
+        self._selection_outline_pen = QPen(QColor(0, 0, 255, 200), 2)  # More opaque blue
+        self._grid_lines = []  # Cached grid lines in widget coordinates
+        self._grid_key = None  # Geometry the cached grid lines were built for
         self.padding = 0
         self.padding_preview = 0  # New variable for padding preview
         self.setMinimumSize(800, 600)
@@ -34,12 +117,20 @@ class SpriteCanvas(QLabel):
         self.zoom_factor = 1.0  # Default zoom level (1x)
         self.zoom_levels = [1.0, 2.0, 4.0, 6.0]  # Available zoom levels
         self.current_zoom_index = 0  # Start at 1x zoom
+        self._scratch = np.empty(0, dtype=np.uint8)  # Reused backing for export images
+        self.png_compress_level = PNG_FAST_COMPRESS_LEVEL  # zlib level for PNG exports
+        self.update_zoomed_sizes()
         
         # Create a checkered background for transparent sprites
         self.setStyleSheet("background-color: white;")
+        self._checker_tile = QPixmapCache.find("sprite_toolz_checker")
+        if self._checker_tile is None:
+            self._checker_tile = self.create_checker_tile()
+            QPixmapCache.insert("sprite_toolz_checker", self._checker_tile)
         
         # Selection variables
-        self.selected_cells = []
+        self._selected_cells = np.empty((0, 2), dtype=np.intp)  # (N, 2) cells, None until listed
+        self._selection_rect = None  # (min_col, min_row, max_col, max_row) of the selection
         self.selection_start = None
         self.selection_end = None
         self.is_selecting = False
@@ -47,79 +138,114 @@ class SpriteCanvas(QLabel):
         self.selected_column = -1
         
         # Add custom frame selection variables
-        self.custom_frame_selection = []  # List to store frames in selection order
+        self.custom_frame_selection = {}  # Ordered dict of frames, keeps selection order
         self.is_custom_selecting = False  # Flag for custom selection mode
         
     def load_spritesheet(self, filename):
-        self.sprite_image = Image.open(filename)
-        self.original_image = self.sprite_image.copy()  # Store original image
-        self.spritesheet = np.array(self.sprite_image)
+        self.set_sprite_image(Image.open(filename))
+        self._orig_arr = self.spritesheet  # Buffers are replaced, never mutated
+        
+    @property
+    def sprite_image(self):
+        """PIL view of the pixel buffer, built only when a caller needs one"""
+        if self._sprite_image is None and self.spritesheet is not None:
+            self._sprite_image = Image.fromarray(self.spritesheet)
+        return self._sprite_image
+    
+    @sprite_image.setter
+    def sprite_image(self, image):
+        self.set_sprite_image(image)
+        
+    def set_spritesheet(self, spritesheet):
+        """Replace the RGBA pixel buffer and refresh the display"""
+        self.spritesheet = spritesheet
+        self._sprite_image = None
+        self._pixmap_dirty = True
         self.update_pixmap()
         
+    def set_sprite_image(self, image):
+        """Replace the sprite image, keeping the pixel buffer in sync"""
+        if image.mode != 'RGBA':
+            image = image.convert('RGBA')
+        self.set_spritesheet(np.asarray(image))
+        
+    def update_zoomed_sizes(self):
+        """Recompute the zoomed cell and sheet sizes read by the mouse handlers"""
+        self._cell_width_zoomed = int(self.cell_width * self.zoom_factor)
+        self._cell_height_zoomed = int(self.cell_height * self.zoom_factor)
+        if self.spritesheet is None:
+            self._sprite_width_zoomed = self._sprite_height_zoomed = 0
+        else:
+            self._sprite_width_zoomed = int(self.spritesheet.shape[1] * self.zoom_factor)
+            self._sprite_height_zoomed = int(self.spritesheet.shape[0] * self.zoom_factor)
+        
     def update_pixmap(self):
-        if self.sprite_image is None:
+        if self.spritesheet is None:
             return
             
-        # Convert PIL Image to QPixmap with proper transparency
-        if self.sprite_image.mode == 'RGBA':
-            # For RGBA images (with transparency)
-            data = self.sprite_image.tobytes("raw", "RGBA")
-            qim = QImage(data, self.sprite_image.size[0], self.sprite_image.size[1], 
-                       self.sprite_image.size[0] * 4, QImage.Format.Format_RGBA8888)
-        elif self.sprite_image.mode == 'RGB':
-            # For RGB images (no transparency)
-            data = self.sprite_image.tobytes("raw", "RGB")
-            qim = QImage(data, self.sprite_image.size[0], self.sprite_image.size[1], 
-                       self.sprite_image.size[0] * 3, QImage.Format.Format_RGB888)
-        else:
-            # Convert other modes to RGBA for consistent handling
-            converted_img = self.sprite_image.convert('RGBA')
-            data = converted_img.tobytes("raw", "RGBA")
-            qim = QImage(data, converted_img.size[0], converted_img.size[1], 
-                       converted_img.size[0] * 4, QImage.Format.Format_RGBA8888)
-            
-        # Create pixmap and set it to the label
-        pixmap = QPixmap.fromImage(qim)
-        
-        # Apply zoom if needed
-        if self.zoom_factor != 1.0:
-            zoom_width = int(pixmap.width() * self.zoom_factor)
-            zoom_height = int(pixmap.height() * self.zoom_factor)
-            pixmap = pixmap.scaled(zoom_width, zoom_height, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.FastTransformation)
+        # Sheet size or zoom may have changed
+        self.update_zoomed_sizes()
         
-        self.setPixmap(pixmap)
+        # Only rebuild the base pixmap when the sprite image has changed;
+        # zooming never copies pixels, the painter scales it when drawing
+        if self._pixmap_dirty or self._base_pixmap is None:
+            self._base_pixmap = self.array_to_pixmap(self.spritesheet)
+            self.setPixmap(self._base_pixmap)
+            self._pixmap_dirty = False
         
         # Set an appropriate size for the canvas
-        self.resize(pixmap.size())
-        self.setMinimumSize(pixmap.size())
+        zoomed_size = QSize(self._sprite_width_zoomed, self._sprite_height_zoomed)
+        self.resize(zoomed_size)
+        self.setMinimumSize(zoomed_size)
         
         # Ensure update
         self.update()
     
+    def array_to_pixmap(self, arr):
+        """Wrap an RGBA array in a QImage without copying and upload it as a QPixmap"""
+        # fromImage copies the pixels, so arr only has to outlive this call
+        arr = np.ascontiguousarray(arr)
+        qim = QImage(arr.data, arr.shape[1], arr.shape[0], arr.strides[0],
+                     QImage.Format.Format_RGBA8888)
+        return QPixmap.fromImage(qim)
+    
+    def create_checker_tile(self, checker_size=10):
+        """Create a 2x2 checker tile that can be repeated across the canvas"""
+        tile = QPixmap(checker_size * 2, checker_size * 2)
+        tile.fill(QColor(255, 255, 255))
+        painter = QPainter(tile)
+        light_gray = QColor(220, 220, 220)
+        painter.fillRect(checker_size, 0, checker_size, checker_size, light_gray)
+        painter.fillRect(0, checker_size, checker_size, checker_size, light_gray)
+        painter.end()
+        return tile
+    
     def mousePressEvent(self, event):
-        if self.sprite_image is None:
+        if self.spritesheet is None:
             return
             
         if event.button() == Qt.MouseButton.LeftButton:
             x, y = event.position().x(), event.position().y()
+            sprite_width_zoomed = self._sprite_width_zoomed
+            sprite_height_zoomed = self._sprite_height_zoomed
             
             # Calculate offset for centering
-            x_offset = max(0, (self.width() - int(self.sprite_image.size[0] * self.zoom_factor)) // 2)
-            y_offset = max(0, (self.height() - int(self.sprite_image.size[1] * self.zoom_factor)) // 2)
+            x_offset = max(0, (self.width() - sprite_width_zoomed) // 2)
+            y_offset = max(0, (self.height() - sprite_height_zoomed) // 2)
             
             # Adjust for offset
-            x = x - x_offset
-            y = y - y_offset
+            x = int(x) - x_offset
+            y = int(y) - y_offset
             
             # Check if click is outside the image area
             if (x < 0 or y < 0 or 
-                x >= self.sprite_image.size[0] * self.zoom_factor or 
-                y >= self.sprite_image.size[1] * self.zoom_factor):
+                x >= sprite_width_zoomed or 
+                y >= sprite_height_zoomed):
                 return
             
             # Account for zoom factor when calculating cell coordinates
-            cell_x = int(x // (self.cell_width * self.zoom_factor))
-            cell_y = int(y // (self.cell_height * self.zoom_factor))
+            cell_x = x // self._cell_width_zoomed
+            cell_y = y // self._cell_height_zoomed
             
             # Get keyboard modifiers
             modifiers = QApplication.keyboardModifiers()
@@ -131,10 +257,10 @@ class SpriteCanvas(QLabel):
                 self.is_custom_selecting = True
                 frame_pos = (cell_x, cell_y)
                 if frame_pos not in self.custom_frame_selection:
-                    self.custom_frame_selection.append(frame_pos)
+                    self.custom_frame_selection[frame_pos] = None
                 else:
-                    self.custom_frame_selection.remove(frame_pos)
-                self.selected_cells = self.custom_frame_selection.copy()
+                    del self.custom_frame_selection[frame_pos]
+                self.selected_cells = list(self.custom_frame_selection)
                 self.selected_row = -1
                 self.selected_column = -1
             else:
@@ -167,33 +293,42 @@ class SpriteCanvas(QLabel):
                 self.parent().parent().parent().update_button_states()
     
     def mouseMoveEvent(self, event):
-        if self.sprite_image is None or self.is_custom_selecting:
+        if self.spritesheet is None or self.is_custom_selecting:
             return
             
         if self.is_selecting and event.buttons() & Qt.MouseButton.LeftButton:
             x, y = event.position().x(), event.position().y()
+            sprite_height, sprite_width = self.spritesheet.shape[:2]
+            sprite_width_zoomed = self._sprite_width_zoomed
+            sprite_height_zoomed = self._sprite_height_zoomed
             
             # Calculate offset for centering
-            x_offset = max(0, (self.width() - int(self.sprite_image.size[0] * self.zoom_factor)) // 2)
-            y_offset = max(0, (self.height() - int(self.sprite_image.size[1] * self.zoom_factor)) // 2)
+            x_offset = max(0, (self.width() - sprite_width_zoomed) // 2)
+            y_offset = max(0, (self.height() - sprite_height_zoomed) // 2)
             
             # Adjust for offset
-            x = x - x_offset
-            y = y - y_offset
+            x = int(x) - x_offset
+            y = int(y) - y_offset
             
             # Clamp coordinates to image boundaries
-            x = max(0, min(x, self.sprite_image.size[0] * self.zoom_factor - 1))
-            y = max(0, min(y, self.sprite_image.size[1] * self.zoom_factor - 1))
+            x = max(0, min(x, sprite_width_zoomed - 1))
+            y = max(0, min(y, sprite_height_zoomed - 1))
             
             # Account for zoom factor when calculating cell coordinates
-            cell_x = max(0, min(int(x // (self.cell_width * self.zoom_factor)), 
-                                int(self.sprite_image.size[0] // self.cell_width) - 1))
-            cell_y = max(0, min(int(y // (self.cell_height * self.zoom_factor)), 
-                                int(self.sprite_image.size[1] // self.cell_height) - 1))
+            cell_x = max(0, min(x // self._cell_width_zoomed, 
+                                sprite_width // self.cell_width - 1))
+            cell_y = max(0, min(y // self._cell_height_zoomed, 
+                                sprite_height // self.cell_height - 1))
             
+            # Nothing to do while the cursor stays inside the same cell
+            if (cell_x, cell_y) == self.selection_end:
+                return
+            
+            # Repaint only the area covered by the old and new selection
+            dirty = self.selection_bounds()
             self.selection_end = (cell_x, cell_y)
             self.update_selection()
-            self.update()
+            self.update(dirty.united(self.selection_bounds()))
             
             # Update UI
             if hasattr(self.parent().parent().parent(), 'update_selection_label'):
@@ -209,6 +344,29 @@ class SpriteCanvas(QLabel):
             if hasattr(self.parent().parent().parent(), 'update_button_states'):
                 self.parent().parent().parent().update_button_states()
     
+    @property
+    def selected_cells(self):
+        """Selected (col, row) cells as an (N, 2) array, listed from the selection rect on demand"""
+        if self._selected_cells is None:
+            if self._selection_rect is None:
+                self._selected_cells = np.empty((0, 2), dtype=np.intp)
+            else:
+                min_x, min_y, max_x, max_y = self._selection_rect
+                rows, cols = np.mgrid[min_y:max_y + 1, min_x:max_x + 1]
+                self._selected_cells = np.column_stack((cols.ravel(), rows.ravel()))
+        return self._selected_cells
+    
+    @selected_cells.setter
+    def selected_cells(self, cells):
+        self._selected_cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        self._selection_rect = None
+    
+    def has_selection(self):
+        """Whether any cell is selected, without listing the cells"""
+        if self._selection_rect is not None:
+            return True
+        return self._selected_cells is not None and len(self._selected_cells) > 0
+    
     def update_selection(self):
         if self.is_custom_selecting:
             # For custom selection, selected_cells is already updated
@@ -220,13 +378,13 @@ class SpriteCanvas(QLabel):
         if self.selected_row >= 0:
             # Select entire row
             row = self.selected_row
-            max_cols = self.sprite_image.size[0] // self.cell_width
-            self.selected_cells = [(col, row) for col in range(max_cols)]
+            max_cols = self.spritesheet.shape[1] // self.cell_width
+            rect = (0, row, max_cols - 1, row)
         elif self.selected_column >= 0:
             # Select entire column
             col = self.selected_column
-            max_rows = self.sprite_image.size[1] // self.cell_height
-            self.selected_cells = [(col, row) for row in range(max_rows)]
+            max_rows = self.spritesheet.shape[0] // self.cell_height
+            rect = (col, 0, col, max_rows - 1)
         else:
             # Select rectangle of cells
             start_x, start_y = self.selection_start
@@ -234,114 +392,112 @@ class SpriteCanvas(QLabel):
             
             min_x, max_x = min(start_x, end_x), max(start_x, end_x)
             min_y, max_y = min(start_y, end_y), max(start_y, end_y)
+            rect = (min_x, min_y, max_x, max_y)
+        
+        # Keep only the bounds; selected_cells lists the cells when asked
+        self._selection_rect = rect if rect[0] <= rect[2] and rect[1] <= rect[3] else None
+        self._selected_cells = None
+    
+    def selection_bounds(self):
+        """Widget rect covered by the row, column or rectangle selection"""
+        if self._selection_rect is None or self.spritesheet is None:
+            return QRect()
+            
+        cell_width_zoomed = self._cell_width_zoomed
+        cell_height_zoomed = self._cell_height_zoomed
+        sprite_width_zoomed = self._sprite_width_zoomed
+        sprite_height_zoomed = self._sprite_height_zoomed
+        x_offset = max(0, (self.width() - sprite_width_zoomed) // 2)
+        y_offset = max(0, (self.height() - sprite_height_zoomed) // 2)
+        
+        min_x, min_y, max_x, max_y = self._selection_rect
+        rect = QRect(
+            min_x * cell_width_zoomed + x_offset,
+            min_y * cell_height_zoomed + y_offset,
+            (max_x - min_x + 1) * cell_width_zoomed,
+            (max_y - min_y + 1) * cell_height_zoomed
+        )
+        
+        # Row and column outlines run to the sheet edge, past the last whole cell
+        if self.selected_row >= 0:
+            rect = rect.united(QRect(x_offset, rect.y(), sprite_width_zoomed, rect.height()))
+        elif self.selected_column >= 0:
+            rect = rect.united(QRect(rect.x(), y_offset, rect.width(), sprite_height_zoomed))
             
-            self.selected_cells = []
-            for y in range(min_y, max_y + 1):
-                for x in range(min_x, max_x + 1):
-                    self.selected_cells.append((x, y))
+        # Leave room for the outline pen straddling the edge
+        return rect.adjusted(-2, -2, 2, 2)
     
     def paintEvent(self, event):
-        # Draw checkered background for transparency
         painter = QPainter(self)
+        painter.setClipRect(event.rect())
         
-        # Create checkered pattern for transparent areas
-        checker_size = 10
-        light_gray = QColor(220, 220, 220)
-        white = QColor(255, 255, 255)
-        
-        for y in range(0, self.height(), checker_size):
-            for x in range(0, self.width(), checker_size):
-                color = light_gray if ((x // checker_size) + (y // checker_size)) % 2 else white
-                painter.fillRect(x, y, checker_size, checker_size, color)
-        
-        # Center the pixmap in the canvas
-        if self.pixmap() and not self.pixmap().isNull():
-            # Calculate center position
-            x_offset = max(0, (self.width() - self.pixmap().width()) // 2)
-            y_offset = max(0, (self.height() - self.pixmap().height()) // 2)
-            
-            # Draw the pixmap at the centered position
-            painter.drawPixmap(x_offset, y_offset, self.pixmap())
+        # Only the repainted area is drawn, so nothing is rasterized outside
+        # the scroll viewport or away from a moving selection
+        self.paint_sheet(painter, event.rect())
         
-        if self.sprite_image is None:
+        if self.spritesheet is None:
             painter.end()
             return
         
-        # Get center offset for grid and selection drawing
-        x_offset = max(0, (self.width() - int(self.sprite_image.size[0] * self.zoom_factor)) // 2)
-        y_offset = max(0, (self.height() - int(self.sprite_image.size[1] * self.zoom_factor)) // 2)
+        # Hoist the zoomed sizes used by the selection drawing
+        cell_width_zoomed = self._cell_width_zoomed
+        cell_height_zoomed = self._cell_height_zoomed
+        sprite_width_zoomed = self._sprite_width_zoomed
+        sprite_height_zoomed = self._sprite_height_zoomed
         
-        # Draw the grid
-        if self.show_grid:
-            pen = QPen(self.grid_color)
-            pen.setWidth(1)
-            painter.setPen(pen)
-            
-            # Draw vertical lines with zoom factor
-            cell_width_zoomed = self.cell_width * self.zoom_factor
-            sprite_width_zoomed = self.sprite_image.size[0] * self.zoom_factor
-            
-            # Draw all vertical lines including the right edge
-            for x in range(0, int(sprite_width_zoomed) + 1, int(cell_width_zoomed)):
-                painter.drawLine(
-                    x + x_offset, 
-                    y_offset, 
-                    x + x_offset, 
-                    int(self.sprite_image.size[1] * self.zoom_factor) + y_offset
-                )
-                
-            # Draw horizontal lines with zoom factor
-            cell_height_zoomed = self.cell_height * self.zoom_factor
-            sprite_height_zoomed = self.sprite_image.size[1] * self.zoom_factor
-            
-            # Draw all horizontal lines including the bottom edge
-            for y in range(0, int(sprite_height_zoomed) + 1, int(cell_height_zoomed)):
-                painter.drawLine(
-                    x_offset, 
-                    y + y_offset, 
-                    int(sprite_width_zoomed) + x_offset, 
-                    y + y_offset
-                )
+        # Get center offset for selection drawing
+        x_offset = max(0, (self.width() - sprite_width_zoomed) // 2)
+        y_offset = max(0, (self.height() - sprite_height_zoomed) // 2)
         
         # Draw selection
-        if self.selected_cells:
-            highlight_color = QColor(0, 0, 255, 80)  # Semi-transparent blue
-            painter.setBrush(highlight_color)
+        if self.has_selection():
+            painter.setBrush(self._selection_brush)
             painter.setPen(Qt.PenStyle.NoPen)
             
-            for cell_x, cell_y in self.selected_cells:
-                rect = QRect(
-                    int(cell_x * self.cell_width * self.zoom_factor) + x_offset, 
-                    int(cell_y * self.cell_height * self.zoom_factor) + y_offset,
-                    int(self.cell_width * self.zoom_factor), 
-                    int(self.cell_height * self.zoom_factor)
-                )
-                painter.drawRect(rect)
+            if self.is_custom_selecting:
+                # Batch the individual cells into a single call
+                painter.drawRects([
+                    QRect(
+                        cell_x * cell_width_zoomed + x_offset, 
+                        cell_y * cell_height_zoomed + y_offset,
+                        cell_width_zoomed, 
+                        cell_height_zoomed
+                    )
+                    for cell_x, cell_y in self.selected_cells.tolist()
+                ])
+            else:
+                # Row, column and rectangle selections are one block of cells
+                min_x, min_y, max_x, max_y = self._selection_rect
+                painter.drawRect(QRect(
+                    min_x * cell_width_zoomed + x_offset, 
+                    min_y * cell_height_zoomed + y_offset,
+                    (max_x - min_x + 1) * cell_width_zoomed, 
+                    (max_y - min_y + 1) * cell_height_zoomed
+                ))
             
             # Draw bold outline around selection
-            outline_color = QColor(0, 0, 255, 200)  # More opaque blue
-            painter.setPen(QPen(outline_color, 2))
+            painter.setPen(self._selection_outline_pen)
             painter.setBrush(Qt.BrushStyle.NoBrush)
             
             if self.selected_row >= 0:
                 # Draw row outline
                 rect = QRect(
                     x_offset, 
-                    int(self.selected_row * self.cell_height * self.zoom_factor) + y_offset,
-                    int(self.sprite_image.size[0] * self.zoom_factor), 
-                    int(self.cell_height * self.zoom_factor)
+                    self.selected_row * cell_height_zoomed + y_offset,
+                    sprite_width_zoomed, 
+                    cell_height_zoomed
                 )
                 painter.drawRect(rect)
             elif self.selected_column >= 0:
                 # Draw column outline
                 rect = QRect(
-                    int(self.selected_column * self.cell_width * self.zoom_factor) + x_offset, 
+                    self.selected_column * cell_width_zoomed + x_offset, 
                     y_offset,
-                    int(self.cell_width * self.zoom_factor), 
-                    int(self.sprite_image.size[1] * self.zoom_factor)
+                    cell_width_zoomed, 
+                    sprite_height_zoomed
                 )
                 painter.drawRect(rect)
-            else:
+            elif self.selection_start is not None:
                 # Draw rectangle outline
                 start_x, start_y = self.selection_start
                 end_x, end_y = self.selection_end
@@ -350,85 +506,124 @@ class SpriteCanvas(QLabel):
                 min_y, max_y = min(start_y, end_y), max(start_y, end_y)
                 
                 rect = QRect(
-                    int(min_x * self.cell_width * self.zoom_factor) + x_offset, 
-                    int(min_y * self.cell_height * self.zoom_factor) + y_offset,
-                    int((max_x - min_x + 1) * self.cell_width * self.zoom_factor), 
-                    int((max_y - min_y + 1) * self.cell_height * self.zoom_factor)
+                    min_x * cell_width_zoomed + x_offset, 
+                    min_y * cell_height_zoomed + y_offset,
+                    (max_x - min_x + 1) * cell_width_zoomed, 
+                    (max_y - min_y + 1) * cell_height_zoomed
                 )
                 painter.drawRect(rect)
                 
         painter.end()
         
+    def paint_sheet(self, painter, rect):
+        """Paint the checker background, sprite and grid inside rect"""
+        # Tile the cached checker pattern, anchored to the widget origin
+        tile = self._checker_tile
+        painter.drawTiledPixmap(rect, tile, QPoint(rect.x() % tile.width(), rect.y() % tile.height()))
+        
+        if self.spritesheet is None or not self.pixmap() or self.pixmap().isNull():
+            return
+            
+        # Center the sheet in the canvas
+        x_offset = max(0, (self.width() - self._sprite_width_zoomed) // 2)
+        y_offset = max(0, (self.height() - self._sprite_height_zoomed) // 2)
+        
+        # Scale only the source pixels under rect, widened to whole pixels, so
+        # zooming never rasterizes the hidden part of the sheet
+        zoom = self.zoom_factor
+        sheet_height, sheet_width = self.spritesheet.shape[:2]
+        if zoom >= 1:
+            left = max(0, int((rect.left() - x_offset) // zoom))
+            top = max(0, int((rect.top() - y_offset) // zoom))
+            right = min(sheet_width, int((rect.right() + 1 - x_offset) // zoom) + 1)
+            bottom = min(sheet_height, int((rect.bottom() + 1 - y_offset) // zoom) + 1)
+        else:
+            # Downscaled sheets are smaller than the source, so draw them whole
+            left, top, right, bottom = 0, 0, sheet_width, sheet_height
+        if left < right and top < bottom:
+            target = QRect(x_offset + int(left * zoom), y_offset + int(top * zoom),
+                           int(right * zoom) - int(left * zoom), int(bottom * zoom) - int(top * zoom))
+            source = QRect(left, top, right - left, bottom - top)
+            # Nearest-neighbour upscale at blit time
+            painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+            painter.drawPixmap(target, self.pixmap(), source)
+        
+        # Draw the grid
+        if self.show_grid:
+            painter.setPen(self._grid_pen)
+            
+            # Rebuild the line list only when the grid geometry changes
+            grid_key = (self.cell_width, self.cell_height, zoom,
+                        self.spritesheet.shape, x_offset, y_offset)
+            if grid_key != self._grid_key:
+                self._grid_lines = self.build_grid_lines(x_offset, y_offset)
+                self._grid_key = grid_key
+            
+            painter.drawLines(self._grid_lines)
+        
+    def build_grid_lines(self, x_offset, y_offset):
+        """Build the vertical and horizontal grid lines for the current zoom"""
+        cell_width_zoomed = self.cell_width * self.zoom_factor
+        cell_height_zoomed = self.cell_height * self.zoom_factor
+        sprite_width_zoomed = int(self.spritesheet.shape[1] * self.zoom_factor)
+        sprite_height_zoomed = int(self.spritesheet.shape[0] * self.zoom_factor)
+        
+        # Vertical lines including the right edge
+        lines = [
+            QLine(x + x_offset, y_offset, x + x_offset, sprite_height_zoomed + y_offset)
+            for x in range(0, sprite_width_zoomed + 1, int(cell_width_zoomed))
+        ]
+        # Horizontal lines including the bottom edge
+        lines.extend(
+            QLine(x_offset, y + y_offset, sprite_width_zoomed + x_offset, y + y_offset)
+            for y in range(0, sprite_height_zoomed + 1, int(cell_height_zoomed))
+        )
+        return lines
+        
     def set_cell_size(self, width, height):
+        if (width, height) == (self.cell_width, self.cell_height):
+            return  # Nothing to redraw
         self.cell_width = width
         self.cell_height = height
+        self.update_zoomed_sizes()
         self.update()
         
     def set_grid_visible(self, visible):
         """Set grid visibility and force update"""
+        if visible == self.show_grid:
+            return
         self.show_grid = visible
         self.update()  # Force a repaint
         
     def set_grid_color(self, color):
+        if color == self.grid_color:
+            return
         self.grid_color = color
+        self._grid_pen = QPen(color, 1)
         self.update()
         
     def set_padding(self, padding):
         """Preview padding without applying it"""
-        if self.sprite_image is None or padding == self.padding_preview:
+        if self.spritesheet is None or padding == self.padding_preview:
             return
             
         self.padding_preview = padding
         
         if padding == 0:
             # Reset to original image for preview
-            self.sprite_image = self.original_image.copy()
-            self.spritesheet = np.array(self.sprite_image)
-            self.update_pixmap()
+            self.set_spritesheet(self._orig_arr)
             return
             
-        # Calculate number of cells in the sheet
-        cols = self.original_image.size[0] // self.cell_width
-        rows = self.original_image.size[1] // self.cell_height
-        
-        # Create a new image with padding for preview
-        padded_width = cols * (self.cell_width + 2 * padding)
-        padded_height = rows * (self.cell_height + 2 * padding)
-        padded_image = Image.new(
-            self.original_image.mode, 
-            (padded_width, padded_height), 
-            (0, 0, 0, 0)  # Transparent background
-        )
-        
-        # Copy each cell with padding
-        for row in range(rows):
-            for col in range(cols):
-                # Source coordinates from original image
-                src_x = col * self.cell_width
-                src_y = row * self.cell_height
-                
-                # Destination coordinates (with padding)
-                dst_x = col * (self.cell_width + 2 * padding) + padding
-                dst_y = row * (self.cell_height + 2 * padding) + padding
-                
-                # Extract cell from original image and paste it in the new image
-                cell = self.original_image.crop(
-                    (src_x, src_y, src_x + self.cell_width, src_y + self.cell_height)
-                )
-                padded_image.paste(cell, (dst_x, dst_y))
-        
         # Update the sprite image for preview
-        self.sprite_image = padded_image
-        self.spritesheet = np.array(self.sprite_image)
-        self.update_pixmap()
+        self.set_spritesheet(pad_cells(self._orig_arr, self.cell_width, self.cell_height, padding))
 
     def apply_padding(self):
         """Actually apply the padding permanently"""
-        if self.sprite_image is None or self.padding_preview == 0:
+        if self.spritesheet is None or self.padding_preview == 0:
             return
             
-        # Update the original image with the current padded version
-        self.original_image = self.sprite_image.copy()
+        # Promote the padded preview buffer to the new original
+        self._orig_arr = self.spritesheet
         
         # Update cell dimensions to include padding
         self.cell_width = self.cell_width + 2 * self.padding_preview
@@ -441,151 +636,87 @@ class SpriteCanvas(QLabel):
         self.update_pixmap()
         
     def remove_row(self, row_index):
-        if self.sprite_image is None or row_index < 0:
+        if self.spritesheet is None or row_index < 0:
             return False
             
         # Calculate number of cells in the sheet
-        cols = self.sprite_image.size[0] // self.cell_width
-        rows = self.sprite_image.size[1] // self.cell_height
+        cols = self.spritesheet.shape[1] // self.cell_width
+        rows = self.spritesheet.shape[0] // self.cell_height
         
         if row_index >= rows:
             return False
             
-        # Create a new image without the selected row
-        new_width = self.sprite_image.size[0]
-        new_height = self.sprite_image.size[1] - self.cell_height
-        new_image = Image.new(
-            self.sprite_image.mode, 
-            (new_width, new_height), 
-            (0, 0, 0, 0)  # Transparent background
+        # Drop the row's block of pixel rows in a single operation
+        cell_height = self.cell_height
+        new_sheet = np.delete(
+            self.spritesheet,
+            np.s_[row_index * cell_height:(row_index + 1) * cell_height],
+            axis=0
         )
         
-        # Copy each row except the one to be removed
-        y_offset = 0
-        for row in range(rows):
-            if row == row_index:
-                continue
-                
-            # Source coordinates for this row
-            src_y = row * self.cell_height
-            
-            # Extract row and paste it in the new image
-            row_img = self.sprite_image.crop(
-                (0, src_y, new_width, src_y + self.cell_height)
-            )
-            new_image.paste(row_img, (0, y_offset))
-            y_offset += self.cell_height
-        
-        # Update the sprite image
-        self.sprite_image = new_image
-        self.spritesheet = np.array(self.sprite_image)
-        
         # Clear selection
         self.selected_cells = []
         self.selected_row = -1
         
-        # Update display
-        self.update_pixmap()
+        # Update the sprite image and display
+        self.set_spritesheet(new_sheet)
         return True
         
     def remove_column(self, col_index):
-        if self.sprite_image is None or col_index < 0:
+        if self.spritesheet is None or col_index < 0:
             return False
             
         # Calculate number of cells in the sheet
-        cols = self.sprite_image.size[0] // self.cell_width
-        rows = self.sprite_image.size[1] // self.cell_height
+        cols = self.spritesheet.shape[1] // self.cell_width
+        rows = self.spritesheet.shape[0] // self.cell_height
         
         if col_index >= cols:
             return False
             
-        # Create a new image without the selected column
-        new_width = self.sprite_image.size[0] - self.cell_width
-        new_height = self.sprite_image.size[1]
-        new_image = Image.new(
-            self.sprite_image.mode, 
-            (new_width, new_height), 
-            (0, 0, 0, 0)  # Transparent background
+        # Drop the column's block of pixel columns in a single operation
+        cell_width = self.cell_width
+        new_sheet = np.delete(
+            self.spritesheet,
+            np.s_[col_index * cell_width:(col_index + 1) * cell_width],
+            axis=1
         )
         
-        # Copy each column except the one to be removed
-        x_offset = 0
-        for col in range(cols):
-            if col == col_index:
-                continue
-                
-            # Source coordinates for this column
-            src_x = col * self.cell_width
-            
-            # Extract column and paste it in the new image
-            col_img = self.sprite_image.crop(
-                (src_x, 0, src_x + self.cell_width, new_height)
-            )
-            new_image.paste(col_img, (x_offset, 0))
-            x_offset += self.cell_width
-        
-        # Update the sprite image
-        self.sprite_image = new_image
-        self.spritesheet = np.array(self.sprite_image)
-        
         # Clear selection
         self.selected_cells = []
         self.selected_column = -1
         
-        # Update display
-        self.update_pixmap()
+        # Update the sprite image and display
+        self.set_spritesheet(new_sheet)
         return True
         
     def export_selection_as_gif(self, filename):
-        if not self.selected_cells or self.sprite_image is None:
+        if not self.has_selection() or self.spritesheet is None:
             return False
             
-        # Extract selected cells as frames
-        frames = []
-        
         # If using custom frame selection, use the frames in selection order
         if self.is_custom_selecting:
-            for col, row in self.custom_frame_selection:
-                # Extract the frame
-                x = col * self.cell_width
-                y = row * self.cell_height
-                frame = self.sprite_image.crop(
-                    (x, y, x + self.cell_width, y + self.cell_height)
-                )
-                frames.append(frame)
+            cells = list(self.custom_frame_selection)
         else:
             # If a row is selected, export frames horizontally
             if self.selected_row >= 0:
                 row = self.selected_row
-                max_cols = self.sprite_image.size[0] // self.cell_width
-                
-                for col in range(max_cols):
-                    # Extract the frame
-                    x = col * self.cell_width
-                    y = row * self.cell_height
-                    frame = self.sprite_image.crop(
-                        (x, y, x + self.cell_width, y + self.cell_height)
-                    )
-                    frames.append(frame)
+                max_cols = self.spritesheet.shape[1] // self.cell_width
+                cells = [(col, row) for col in range(max_cols)]
                 
             # If a column is selected, export frames vertically
             elif self.selected_column >= 0:
                 col = self.selected_column
-                max_rows = self.sprite_image.size[1] // self.cell_height
-                
-                for row in range(max_rows):
-                    # Extract the frame
-                    x = col * self.cell_width
-                    y = row * self.cell_height
-                    frame = self.sprite_image.crop(
-                        (x, y, x + self.cell_width, y + self.cell_height)
-                    )
-                    frames.append(frame)
+                max_rows = self.spritesheet.shape[0] // self.cell_height
+                cells = [(col, row) for row in range(max_rows)]
                 
             # If a custom selection is made, export frames in reading order
             else:
                 # Sort cells by row then column for reading order
-                cells = sorted(self.selected_cells, key=lambda c: (c[1], c[0]))
+                cells = self.reading_order(self.selected_cells)
+        
+        # Slice the frames out of the pixel buffer and quantize them together
+        frames = self.get_frames(cells)
+        frames = palettize_frames(frames) if len(frames) else []
         
         # Save frames as GIF animation
         if frames:
@@ -602,66 +733,117 @@ class SpriteCanvas(QLabel):
         return False
         
     def export_selection_as_apng(self, filename):
-        if not self.selected_cells or self.sprite_image is None:
+        if not self.has_selection() or self.spritesheet is None:
             return False
             
-        # Extract selected cells as frames
-        frames = []
-        
         # If using custom frame selection, use the frames in selection order
         if self.is_custom_selecting:
-            for col, row in self.custom_frame_selection:
-                # Extract the frame
-                x = col * self.cell_width
-                y = row * self.cell_height
-                frame = self.sprite_image.crop(
-                    (x, y, x + self.cell_width, y + self.cell_height)
-                )
-                frames.append(np.array(frame))
+            cells = list(self.custom_frame_selection)
         else:
             # Similar logic to the GIF export
             if self.selected_row >= 0:
                 row = self.selected_row
-                max_cols = self.sprite_image.size[0] // self.cell_width
-                
-                for col in range(max_cols):
-                    x = col * self.cell_width
-                    y = row * self.cell_height
-                    frame = self.sprite_image.crop(
-                        (x, y, x + self.cell_width, y + self.cell_height)
-                    )
-                    frames.append(np.array(frame))
+                max_cols = self.spritesheet.shape[1] // self.cell_width
+                cells = [(col, row) for col in range(max_cols)]
                 
             elif self.selected_column >= 0:
                 col = self.selected_column
-                max_rows = self.sprite_image.size[1] // self.cell_height
-                
-                for row in range(max_rows):
-                    x = col * self.cell_width
-                    y = row * self.cell_height
-                    frame = self.sprite_image.crop(
-                        (x, y, x + self.cell_width, y + self.cell_height)
-                    )
-                    frames.append(np.array(frame))
+                max_rows = self.spritesheet.shape[0] // self.cell_height
+                cells = [(col, row) for row in range(max_rows)]
                 
             else:
-                cells = sorted(self.selected_cells, key=lambda c: (c[1], c[0]))
-                
-                for col, row in cells:
-                    x = col * self.cell_width
-                    y = row * self.cell_height
-                    frame = self.sprite_image.crop(
-                        (x, y, x + self.cell_width, y + self.cell_height)
-                    )
-                    frames.append(np.array(frame))
+                cells = self.reading_order(self.selected_cells)
+        
+        # Extract selected cells as one (frames, height, width, 4) stack
+        frames = self.get_frames(cells)
         
         # Save frames as APNG
-        if frames:
+        if len(frames):
             imageio.mimsave(filename, frames, format='APNG', fps=10)
             return True
             
         return False
 
+    def scratch_buffer(self, height, width):
+        """Return an uninitialized (height, width, 4) array backed by reused memory"""
+        # Only valid until the next call; callers must finish with it first
+        size = height * width * 4
+        if size > self._scratch.size:
+            self._scratch = np.empty(size, dtype=np.uint8)
+        return self._scratch[:size].reshape(height, width, 4)
+    
+    def selection_start_cell(self):
+        """Return the (col, row) cell the selection started in, clamped to the current grid
+        
+        The selection outlives changes to the sheet and cell size, so a stale cell
+        is moved onto the last row or column that still touches the sheet.
+        """
+        col, row = self.selection_start
+        sheet_height, sheet_width = self.spritesheet.shape[:2]
+        cols = max(1, -(-sheet_width // self.cell_width))
+        rows = max(1, -(-sheet_height // self.cell_height))
+        return min(col, cols - 1), min(row, rows - 1)
+    
+    def reading_order(self, cells):
+        """Return the (col, row) cells sorted by row, then column"""
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        return cells[np.lexsort((cells[:, 0], cells[:, 1]))]
+    
+    def get_frames(self, cells):
+        """Return the (col, row) cells as an (N, cell_height, cell_width, 4) array"""
+        cell_width = self.cell_width
+        cell_height = self.cell_height
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        if not len(cells):
+            return np.zeros((0, cell_height, cell_width, 4), dtype=np.uint8)
+        
+        # Zero-copy (rows, cols, h, w) view of the whole cells on the sheet
+        sheet = self.spritesheet
+        rows = sheet.shape[0] // cell_height
+        cols = sheet.shape[1] // cell_width
+        tiles = sheet[:rows * cell_height, :cols * cell_width].reshape(
+            rows, cell_height, cols, cell_width, 4).swapaxes(1, 2)
+        
+        # Gather all cells at once when none of them overhangs the sheet
+        inside = (cells[:, 0] < cols) & (cells[:, 1] < rows)
+        if inside.all():
+            return tiles[cells[:, 1], cells[:, 0]]
+        
+        frames = np.empty((len(cells), cell_height, cell_width, 4), dtype=np.uint8)
+        frames[inside] = tiles[cells[inside, 1], cells[inside, 0]]
+        # Cells clipped by the sheet edge keep the part that lies on the sheet
+        # and blank only the rest
+        for i in np.flatnonzero(~inside):
+            col, row = cells[i]
+            part = sheet[row * cell_height:(row + 1) * cell_height,
+                         col * cell_width:(col + 1) * cell_width]
+            part_height, part_width = part.shape[:2]
+            frames[i, :part_height, :part_width] = part
+            frames[i, :part_height, part_width:] = 0
+            frames[i, part_height:] = 0
+        return frames
+
+    def get_strip(self, index, axis=0):
+        """Return row (axis 0) or column (axis 1) index as a strip one whole cell deep
+        
+        A partial edge strip is zero-padded to the cell size, and a stale index past
+        the sheet is clamped to the last strip on it.
+        """
+        sheet = self.spritesheet
+        size = self.cell_height if axis == 0 else self.cell_width
+        src = np.swapaxes(sheet, 0, axis)
+        index = min(index, max(0, -(-len(src) // size) - 1))
+        part = src[index * size:(index + 1) * size]
+        if len(part) == size:
+            return np.swapaxes(part, 0, axis)  # Whole strip, sliced without copying
+        
+        # Keep what lies on the sheet and blank the rest, as Image.crop would
+        shape = list(sheet.shape)
+        shape[axis] = size
+        strip = np.zeros(shape, dtype=sheet.dtype)
+        np.swapaxes(strip, 0, axis)[:len(part)] = part
+        return strip
+
     def set_zoom(self, zoom_index):
         if 0 <= zoom_index < len(self.zoom_levels):
             self.current_zoom_index = zoom_index
@@ -692,93 +874,323 @@ class SpriteCanvas(QLabel):
 
     def export_selection_as_png(self, filename):
         """Export the selected area as a PNG image"""
-        if not self.selected_cells or self.sprite_image is None:
+        if not self.has_selection() or self.spritesheet is None:
             return False
             
         # If using custom frame selection, create a strip of selected frames
         if self.is_custom_selecting:
-            # Create a new image wide enough for all selected frames
-            width = len(self.custom_frame_selection) * self.cell_width
-            height = self.cell_height
-            new_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            
-            # Copy frames in selection order
-            for i, (col, row) in enumerate(self.custom_frame_selection):
-                # Calculate source and destination coordinates
-                src_x = col * self.cell_width
-                src_y = row * self.cell_height
-                dst_x = i * self.cell_width
-                
-                # Extract and paste the cell
-                cell = self.sprite_image.crop(
-                    (src_x, src_y,
-                     src_x + self.cell_width,
-                     src_y + self.cell_height)
-                )
-                new_img.paste(cell, (dst_x, 0))
+            # Gather the frames in selection order and lay them side by side
+            frames = self.get_frames(list(self.custom_frame_selection))
+            count, cell_height, cell_width = frames.shape[:3]
+            strip = frames.transpose(1, 0, 2, 3).reshape(cell_height, count * cell_width, 4)
             
-            new_img.save(filename)
+            Image.fromarray(strip).save(filename, compress_level=self.png_compress_level)
             return True
             
         # If a row is selected, export the entire row
         if self.selected_row >= 0:
             row = self.selected_row
-            # Extract the row
-            row_img = self.sprite_image.crop(
-                (0, row * self.cell_height,
-                 self.sprite_image.size[0], (row + 1) * self.cell_height)
-            )
-            row_img.save(filename)
+            # Save the row straight from a slice of the pixel buffer
+            row_pixels = self.get_strip(row)
+            Image.fromarray(row_pixels).save(filename, compress_level=self.png_compress_level)
             return True
             
         # If a column is selected, export the entire column
         elif self.selected_column >= 0:
             col = self.selected_column
-            # Extract the column
-            col_img = self.sprite_image.crop(
-                (col * self.cell_width, 0,
-                 (col + 1) * self.cell_width, self.sprite_image.size[1])
-            )
-            col_img.save(filename)
+            # Save the column straight from a slice of the pixel buffer
+            col_pixels = self.get_strip(col, axis=1)
+            Image.fromarray(col_pixels).save(filename, compress_level=self.png_compress_level)
             return True
             
         # If multiple cells are selected, create a new image with all selected cells
         else:
-            # Calculate the size of the output image
-            cells = sorted(self.selected_cells, key=lambda c: (c[1], c[0]))  # Sort by row, then column
-            min_col = min(cell[0] for cell in cells)
-            max_col = max(cell[0] for cell in cells)
-            min_row = min(cell[1] for cell in cells)
-            max_row = max(cell[1] for cell in cells)
-            
-            width = (max_col - min_col + 1) * self.cell_width
-            height = (max_row - min_row + 1) * self.cell_height
-            
-            # Create new image
-            new_img = Image.new('RGBA', (width, height), (0, 0, 0, 0))
-            
-            # Copy selected cells
-            for col, row in cells:
-                # Calculate source and destination coordinates
-                src_x = col * self.cell_width
-                src_y = row * self.cell_height
-                dst_x = (col - min_col) * self.cell_width
-                dst_y = (row - min_row) * self.cell_height
-                
-                # Extract and paste the cell
-                cell = self.sprite_image.crop(
-                    (src_x, src_y,
-                     src_x + self.cell_width,
-                     src_y + self.cell_height)
-                )
-                new_img.paste(cell, (dst_x, dst_y))
+            # Calculate the size of the output image; a dragged selection
+            # already knows its bounds, so only listed cells need a pass
+            if self._selection_rect is not None:
+                cells = None
+                min_col, min_row, max_col, max_row = self._selection_rect
+            else:
+                cells = self.selected_cells
+                min_col, min_row = cells.min(axis=0)
+                max_col, max_row = cells.max(axis=0)
+            cols = max_col - min_col + 1
+            rows = max_row - min_row + 1
+            
+            cell_width = self.cell_width
+            cell_height = self.cell_height
+            output = self.scratch_buffer(rows * cell_height, cols * cell_width)
+            if cells is None or len(cells) == rows * cols:
+                # A filled rectangle of cells is a single slice of the sheet
+                block = self.spritesheet[min_row * cell_height:(max_row + 1) * cell_height,
+                                         min_col * cell_width:(max_col + 1) * cell_width]
+                block_height, block_width = block.shape[:2]
+                output[:block_height, :block_width] = block
+                # Blank only the margin past the sheet edge
+                output[block_height:] = 0
+                output[:block_height, block_width:] = 0
+            else:
+                # Drop every selected cell into its slot of a (rows, h, cols, w) grid
+                output.fill(0)
+                tiles = output.reshape(rows, cell_height, cols, cell_width, 4)
+                tiles[cells[:, 1] - min_row, :, cells[:, 0] - min_col] = self.get_frames(cells)
+            new_img = Image.fromarray(output)
             
-            new_img.save(filename)
+            new_img.save(filename, compress_level=self.png_compress_level)
             return True
             
         return False
 
 
+def edit_sheet(sheet, op, index, size, axis=0):
+    """Duplicate, delete or insert a blank strip of cells along one axis of the sheet
+    
+    op is 'duplicate', 'delete', 'insert_before' or 'insert_after'; index is the
+    cell row (axis 0) or column (axis 1) and size the cell height or width.
+    """
+    # Work on views with the edited axis first so rows and columns share one path
+    src = np.swapaxes(sheet, 0, axis)
+    length = src.shape[0]
+    start, end = index * size, (index + 1) * size
+    last_whole = index >= length // size - 1
+    if op == 'delete' and length < size:
+        return sheet  # No whole strip to remove
+    
+    # Allocate the result once; every pixel of it is written below
+    shape = list(sheet.shape)
+    shape[axis] = length - size if op == 'delete' else length + size
+    new_sheet = np.empty(shape, dtype=sheet.dtype)
+    dst = np.swapaxes(new_sheet, 0, axis)
+    
+    if op == 'duplicate':
+        # Append a copy of the strip, blank where it overhangs the sheet
+        strip = src[start:end]
+        dst[:length] = src
+        dst[length:length + len(strip)] = strip
+        dst[length + len(strip):] = 0
+    elif op == 'delete':
+        # A strip in the partial cell at the edge may start past the new length
+        start = min(start, len(dst))
+        dst[:start] = src[:start]
+        if last_whole:
+            dst[start:] = 0
+        else:
+            dst[start:] = src[end:]
+    elif op == 'insert_before':
+        # A stale index may point past the sheet; the blank strip then lands at the end
+        kept = min(start, length)
+        dst[:kept] = src[:kept]
+        dst[kept:end] = 0
+        dst[end:] = src[kept:]
+    elif op == 'insert_after':
+        if last_whole:
+            # The strip may overhang a sheet shorter than one cell; blank the rest
+            kept = min(end, length)
+            dst[:kept] = src[:kept]
+            dst[kept:] = 0
+        else:
+            dst[:end] = src[:end]
+            dst[end:end + size] = 0
+            dst[end + size:] = src[end:]
+    else:
+        raise ValueError(f"Unknown sheet edit: {op}")
+    return new_sheet
+
+
+SPRITE_SUFFIXES = frozenset(('.png', '.jpg', '.bmp', '.gif'))  # Picked up by batch processing
+
+
+def iter_sprite_files(folder, recursive):
+    """Yield the paths of the sprite sheets in folder, descending into subfolders if recursive"""
+    with os.scandir(folder) as entries:
+        subfolders = []
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                subfolders.append(entry.path)
+            elif os.path.splitext(entry.name)[1].lower() in SPRITE_SUFFIXES and entry.is_file():
+                yield entry.path
+    if recursive:
+        for subfolder in subfolders:
+            try:
+                sub_files = list(iter_sprite_files(subfolder, True))
+            except OSError:
+                continue  # Skip unreadable subfolders, as os.walk does
+            yield from sub_files
+
+
+def process_sprite_file(file_path, input_folder, output_folder, options):
+    """Split one sprite sheet into the batch outputs, returning any per-row errors"""
+    cell_width = options['cell_width']
+    cell_height = options['cell_height']
+    padding = options['padding']
+    export_frames = options['export_frames']
+    export_rows = options['export_rows']
+    export_gif = options['export_gif']
+    export_apng = options['export_apng']
+    apng_per_sheet = options['apng_per_sheet']
+    row_apng = export_apng and not apng_per_sheet
+    compress_level = options['png_compress_level']
+    errors = []
+    
+    # Load sprite sheet; Image.open only parses the header here
+    img = Image.open(file_path)
+    
+    # Padding keeps the cell count, so the grid comes straight from the header
+    sheet_width, sheet_height = img.size
+    cols = sheet_width // cell_width
+    rows = sheet_height // cell_height
+    
+    # Only row strips and animations need the whole padded sheet; frames on
+    # their own are padded one at a time while they are written
+    pad_frames_only = padding > 0 and not (export_rows or export_gif or export_apng)
+    
+    # Create output subfolder matching input structure
+    rel_path = os.path.relpath(os.path.dirname(file_path), input_folder)
+    curr_output_folder = os.path.join(output_folder, rel_path)
+    os.makedirs(curr_output_folder, exist_ok=True)
+    
+    base_name = os.path.splitext(os.path.basename(file_path))[0]
+    
+    # Zero-copy (rows, cols, h, w) view of the whole cells on the sheet,
+    # shared by every export below. Decoding is skipped when no export
+    # would read a pixel.
+    sheet = tiles = None
+    if rows > 0 and (export_frames or export_rows or export_gif or export_apng):
+        # Convert once per sheet so every export reads the same RGBA buffer
+        if img.mode != 'RGBA':
+            img = img.convert('RGBA')
+        sheet = np.asarray(img)
+        
+        # Apply padding if needed
+        if padding > 0 and not pad_frames_only:
+            # Blit the cells into their padded slots in one array copy
+            sheet = pad_cells(sheet, cell_width, cell_height, padding, scratch='padded')
+            cell_width += 2 * padding
+            cell_height += 2 * padding
+        
+        tiles = sheet[:rows * cell_height, :cols * cell_width].reshape(
+            rows, cell_height, cols, cell_width, 4).swapaxes(1, 2)
+    
+    # Export individual frames if requested
+    if export_frames:
+        frames_folder = os.path.join(curr_output_folder, f"{base_name}_frames")
+        os.makedirs(frames_folder, exist_ok=True)
+        
+        if pad_frames_only:
+            # One padded canvas whose transparent border is shared by every frame
+            padded_frame = np.zeros(
+                (cell_height + 2 * padding, cell_width + 2 * padding, 4), dtype=np.uint8)
+            frame_inner = padded_frame[padding:padding + cell_height, padding:padding + cell_width]
+        frame_count = 0
+        
+        for row in range(rows):
+            for col in range(cols):
+                frame = tiles[row, col]
+                if pad_frames_only:
+                    frame_inner[:] = frame
+                    frame = padded_frame
+                Image.fromarray(frame).save(
+                    os.path.join(frames_folder, f"frame_{frame_count:03d}.png"),
+                    compress_level=compress_level)
+                frame_count += 1
+    
+    # Export rows if requested
+    if export_rows or export_gif or row_apng:
+        rows_folder = os.path.join(curr_output_folder, f"{base_name}_rows")
+        os.makedirs(rows_folder, exist_ok=True)
+        
+        for row in range(rows):
+            # The row's frames, sliced once for the GIF and APNG encoders
+            row_tiles = tiles[row]
+            # Only the file name is formatted, so braces in the folder are kept as is
+            row_png_path = os.path.join(rows_folder, f"row_{row:03d}.png")
+            
+            # Export row as strip if requested
+            if export_rows:
+                row_pixels = sheet[row * cell_height:(row + 1) * cell_height]
+                Image.fromarray(row_pixels).save(row_png_path, compress_level=compress_level)
+            
+            # Export as GIF if requested
+            if export_gif:
+                frames = palettize_frames(row_tiles) if cols else []
+                
+                if frames:
+                    try:
+                        gif_path = os.path.join(rows_folder, f"row_{row:03d}.gif")
+                        frames[0].save(
+                            gif_path,
+                            format='GIF',
+                            append_images=frames[1:],
+                            save_all=True,
+                            duration=100,
+                            loop=0,
+                            disposal=2  # Clear previous frame
+                        )
+                    except Exception as e:
+                        errors.append(f"Error creating GIF for row {row}: {str(e)}")
+            
+            # Export as APNG if requested
+            if row_apng:
+                if len(row_tiles):
+                    try:
+                        apng_path = row_png_path
+                        # Save as animated PNG with proper animation settings
+                        imageio.mimsave(
+                            apng_path,
+                            row_tiles,
+                            format='APNG',
+                            fps=10,  # 10 frames per second
+                            loop=0,  # Loop forever
+                            duration=100  # 100ms per frame
+                        )
+                    except Exception as e:
+                        errors.append(f"Error creating animated PNG for row {row}: {str(e)}")
+                        continue
+    
+    # Export the whole sheet as one APNG, row after row, in a single write
+    if export_apng and apng_per_sheet and tiles is not None and cols:
+        try:
+            apng_path = os.path.join(curr_output_folder, f"{base_name}_animation.png")
+            imageio.mimsave(
+                apng_path,
+                tiles.reshape(rows * cols, cell_height, cell_width, 4),
+                format='APNG',
+                fps=10,  # 10 frames per second
+                loop=0,  # Loop forever
+                duration=100  # 100ms per frame
+            )
+        except Exception as e:
+            errors.append(f"Error creating animated PNG for {base_name}: {str(e)}")
+    
+    return errors
+
+
+class BatchSignals(QObject):
+    """Signals a BatchJob posts back to the GUI thread"""
+    finished = pyqtSignal(str, str)  # File path, error message or ""
+
+
+class BatchJob(QRunnable):
+    """Process sprite sheets one after another on a QThreadPool worker"""
+    def __init__(self, file_paths, input_folder, output_folder, options, signals):
+        super().__init__()
+        self.file_paths = file_paths
+        self.input_folder = input_folder
+        self.output_folder = output_folder
+        self.options = options
+        self.signals = signals
+        
+    def run(self):
+        for file_path in self.file_paths:
+            try:
+                errors = process_sprite_file(file_path, self.input_folder,
+                                             self.output_folder, self.options)
+                message = errors[-1] if errors else ""
+            except Exception as e:
+                message = f"Error processing {os.path.basename(file_path)}: {str(e)}"
+            self.signals.finished.emit(file_path, message)
+
+
 class SpriteToolz(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -844,6 +1256,12 @@ class SpriteToolz(QMainWindow):
         self.export_format_group.setLayout(format_layout)
         export_layout.addWidget(self.export_format_group)
         
+        self.fast_png_cb = QCheckBox("Fast PNG")
+        self.fast_png_cb.setToolTip("Compress exported PNGs less for much faster saving")
+        self.fast_png_cb.setChecked(True)
+        self.fast_png_cb.stateChanged.connect(self.toggle_fast_png)
+        export_layout.addWidget(self.fast_png_cb)
+        
         self.export_button = QPushButton("Export Selection")
         self.export_button.clicked.connect(self.export_selection)
         self.export_button.setEnabled(False)
@@ -869,18 +1287,28 @@ class SpriteToolz(QMainWindow):
         manual_layout = QGridLayout()
         manual_layout.setContentsMargins(0, 0, 0, 0)
         
+        # Coalesce bursts of spin box changes (typing, held arrows) into one update
+        self.cell_size_timer = QTimer(self)
+        self.cell_size_timer.setSingleShot(True)
+        self.cell_size_timer.setInterval(50)
+        self.cell_size_timer.timeout.connect(self.update_cell_size)
+        self.cell_count_timer = QTimer(self)
+        self.cell_count_timer.setSingleShot(True)
+        self.cell_count_timer.setInterval(50)
+        self.cell_count_timer.timeout.connect(self.update_cell_size_from_count)
+        
         manual_layout.addWidget(QLabel("Width:"), 0, 0)
         self.cell_width_spin = QSpinBox()
         self.cell_width_spin.setRange(1, 1000)
         self.cell_width_spin.setValue(32)
-        self.cell_width_spin.valueChanged.connect(self.update_cell_size)
+        self.cell_width_spin.valueChanged.connect(lambda: self.cell_size_timer.start())
         manual_layout.addWidget(self.cell_width_spin, 0, 1)
         
         manual_layout.addWidget(QLabel("Height:"), 1, 0)
         self.cell_height_spin = QSpinBox()
         self.cell_height_spin.setRange(1, 1000)
         self.cell_height_spin.setValue(32)
-        self.cell_height_spin.valueChanged.connect(self.update_cell_size)
+        self.cell_height_spin.valueChanged.connect(lambda: self.cell_size_timer.start())
         manual_layout.addWidget(self.cell_height_spin, 1, 1)
         
         self.manual_size_widget.setLayout(manual_layout)
@@ -895,14 +1323,14 @@ class SpriteToolz(QMainWindow):
         self.row_count_spin = QSpinBox()
         self.row_count_spin.setRange(1, 1000)
         self.row_count_spin.setValue(1)
-        self.row_count_spin.valueChanged.connect(self.update_cell_size_from_count)
+        self.row_count_spin.valueChanged.connect(lambda: self.cell_count_timer.start())
         count_layout.addWidget(self.row_count_spin, 0, 1)
         
         count_layout.addWidget(QLabel("Columns:"), 1, 0)
         self.col_count_spin = QSpinBox()
         self.col_count_spin.setRange(1, 1000)
         self.col_count_spin.setValue(1)
-        self.col_count_spin.valueChanged.connect(self.update_cell_size_from_count)
+        self.col_count_spin.valueChanged.connect(lambda: self.cell_count_timer.start())
         count_layout.addWidget(self.col_count_spin, 1, 1)
         
         self.count_size_widget.setLayout(count_layout)
@@ -1052,6 +1480,12 @@ class SpriteToolz(QMainWindow):
         frame_ops_group.setLayout(frame_ops_layout)
         manip_layout.addWidget(frame_ops_group)
         
+        # Buttons toggled by update_button_states, collected once
+        self._manip_buttons = []
+        self._last_manip_state = None  # (has_image, has_selection) last applied to them
+        for group in (row_ops_group, col_ops_group, frame_ops_group):
+            self._manip_buttons.extend(group.findChildren(QPushButton))
+        
         # Add stretch to push everything to the top
         manip_layout.addStretch()
         
@@ -1120,11 +1554,21 @@ class SpriteToolz(QMainWindow):
         self.export_apng_cb = QCheckBox("Export Rows as APNG")
         batch_ops_layout.addWidget(self.export_apng_cb)
         
+        self.apng_per_sheet_cb = QCheckBox("One APNG per Sheet")
+        self.apng_per_sheet_cb.setToolTip("Write all rows of a sheet into a single animated PNG")
+        batch_ops_layout.addWidget(self.apng_per_sheet_cb)
+        
+        self.batch_fast_png_cb = QCheckBox("Fast PNG (larger files)")
+        self.batch_fast_png_cb.setToolTip("Compress frame and strip PNGs less for much faster saving")
+        self.batch_fast_png_cb.setChecked(True)
+        batch_ops_layout.addWidget(self.batch_fast_png_cb)
+        
         # Process button
         self.process_batch_btn = QPushButton("Process Folder")
         self.process_batch_btn.clicked.connect(self.process_batch)
         self.process_batch_btn.setEnabled(False)
         batch_ops_layout.addWidget(self.process_batch_btn)
+        self._batch_running = False  # True while BatchJobs are still reporting back
         
         batch_ops_group.setLayout(batch_ops_layout)
         batch_layout.addWidget(batch_ops_group)
@@ -1174,7 +1618,7 @@ class SpriteToolz(QMainWindow):
             self.statusBar().showMessage(f"Loaded: {filename}")
     
     def export_selection(self):
-        if self.sprite_canvas.sprite_image is None or not self.sprite_canvas.selected_cells:
+        if self.sprite_canvas.spritesheet is None or not self.sprite_canvas.has_selection():
             QMessageBox.warning(self, "No Selection", "Please select cells to export.")
             return
             
@@ -1226,33 +1670,20 @@ class SpriteToolz(QMainWindow):
         try:
             if self.sprite_canvas.is_custom_selecting:
                 # Export frames in selection order
-                for i, (col, row) in enumerate(self.sprite_canvas.custom_frame_selection):
-                    # Extract the frame
-                    x = col * self.sprite_canvas.cell_width
-                    y = row * self.sprite_canvas.cell_height
-                    frame = self.sprite_canvas.sprite_image.crop(
-                        (x, y,
-                         x + self.sprite_canvas.cell_width,
-                         y + self.sprite_canvas.cell_height)
-                    )
-                    # Save frame
-                    frame_path = os.path.join(directory, f"frame_{i:03d}.png")
-                    frame.save(frame_path)
+                cells = list(self.sprite_canvas.custom_frame_selection)
             else:
                 # Handle regular selection (row, column, or area)
-                cells = sorted(self.sprite_canvas.selected_cells, key=lambda c: (c[1], c[0]))
-                for i, (col, row) in enumerate(cells):
-                    # Extract the frame
-                    x = col * self.sprite_canvas.cell_width
-                    y = row * self.sprite_canvas.cell_height
-                    frame = self.sprite_canvas.sprite_image.crop(
-                        (x, y,
-                         x + self.sprite_canvas.cell_width,
-                         y + self.sprite_canvas.cell_height)
-                    )
-                    # Save frame
-                    frame_path = os.path.join(directory, f"frame_{i:03d}.png")
-                    frame.save(frame_path)
+                cells = self.sprite_canvas.reading_order(self.sprite_canvas.selected_cells)
+            frames = self.sprite_canvas.get_frames(cells)
+            compress_level = self.sprite_canvas.png_compress_level
+            
+            def save_frame(i):
+                frame_path = os.path.join(directory, f"frame_{i:03d}.png")
+                Image.fromarray(frames[i]).save(frame_path, compress_level=compress_level)
+            
+            # Pillow releases the GIL while encoding, so frames compress in parallel
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                list(executor.map(save_frame, range(len(frames))))
             return True
         except Exception as e:
             self.statusBar().showMessage(f"Error exporting frames: {str(e)}")
@@ -1271,11 +1702,10 @@ class SpriteToolz(QMainWindow):
             
     def update_cell_size_from_count(self):
         """Update cell size based on row and column counts"""
-        if not self.sprite_canvas.sprite_image:
+        if self.sprite_canvas.spritesheet is None:
             return
             
-        img_width = self.sprite_canvas.sprite_image.size[0]
-        img_height = self.sprite_canvas.sprite_image.size[1]
+        img_height, img_width = self.sprite_canvas.spritesheet.shape[:2]
         
         cols = self.col_count_spin.value()
         rows = self.row_count_spin.value()
@@ -1296,13 +1726,11 @@ class SpriteToolz(QMainWindow):
             self.cell_height_spin.blockSignals(False)
             
             # Update the canvas
-            self.sprite_canvas.cell_width = cell_width
-            self.sprite_canvas.cell_height = cell_height
-            self.sprite_canvas.update()
+            self.sprite_canvas.set_cell_size(cell_width, cell_height)
             
     def update_cell_size(self):
         """Update cell size based on manual width/height values"""
-        if not self.sprite_canvas.sprite_image:
+        if self.sprite_canvas.spritesheet is None:
             return
             
         width = self.cell_width_spin.value()
@@ -1310,8 +1738,7 @@ class SpriteToolz(QMainWindow):
         
         if width > 0 and height > 0:
             # Calculate row/column counts based on cell size
-            img_width = self.sprite_canvas.sprite_image.size[0]
-            img_height = self.sprite_canvas.sprite_image.size[1]
+            img_height, img_width = self.sprite_canvas.spritesheet.shape[:2]
             
             cols = img_width // width
             rows = img_height // height
@@ -1327,9 +1754,7 @@ class SpriteToolz(QMainWindow):
             self.col_count_spin.blockSignals(False)
             
             # Update the canvas
-            self.sprite_canvas.cell_width = width
-            self.sprite_canvas.cell_height = height
-            self.sprite_canvas.update()
+            self.sprite_canvas.set_cell_size(width, height)
     
     def update_padding(self):
         padding = self.padding_spin.value()
@@ -1351,6 +1776,13 @@ class SpriteToolz(QMainWindow):
         self.sprite_canvas.set_grid_visible(state == Qt.CheckState.Checked.value)
         self.statusBar().showMessage("Grid " + ("shown" if state == Qt.CheckState.Checked.value else "hidden"))
 
+    def toggle_fast_png(self, state):
+        """Switch PNG exports between fast and default zlib compression"""
+        fast = state == Qt.CheckState.Checked.value
+        self.sprite_canvas.png_compress_level = (
+            PNG_FAST_COMPRESS_LEVEL if fast else PNG_DEFAULT_COMPRESS_LEVEL)
+        self.statusBar().showMessage("Fast PNG " + ("enabled" if fast else "disabled"))
+
     def change_grid_color(self):
         color = QColorDialog.getColor(self.sprite_canvas.grid_color, self)
         if color.isValid():
@@ -1358,314 +1790,200 @@ class SpriteToolz(QMainWindow):
     
     def duplicate_row(self):
         """Duplicate the selected row"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        height = self.sprite_canvas.cell_height
-        
-        # Create new image with extra row
-        new_height = img.size[1] + height
-        new_img = Image.new('RGBA', (img.size[0], new_height), (0, 0, 0, 0))
-        
-        # Copy original image
-        new_img.paste(img, (0, 0))
-        
-        # Copy selected row to new position
-        row_img = img.crop((0, row * height, img.size[0], (row + 1) * height))
-        new_img.paste(row_img, (0, img.size[1]))
+        row = canvas.selection_start_cell()[1]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'duplicate', row, canvas.cell_height))
         self.statusBar().showMessage(f"Duplicated row {row}")
 
     def delete_row(self):
         """Delete the selected row"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        height = self.sprite_canvas.cell_height
-        
-        # Create new image without the selected row
-        new_height = img.size[1] - height
-        new_img = Image.new('RGBA', (img.size[0], new_height), (0, 0, 0, 0))
-        
-        # Copy parts before and after the selected row
-        if row > 0:
-            new_img.paste(img.crop((0, 0, img.size[0], row * height)), (0, 0))
-        if row < (img.size[1] // height - 1):
-            new_img.paste(img.crop((0, (row + 1) * height, img.size[0], img.size[1])), 
-                         (0, row * height))
+        row = canvas.selection_start_cell()[1]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'delete', row, canvas.cell_height))
         self.statusBar().showMessage(f"Deleted row {row}")
 
     def add_row_before(self):
         """Add a blank row before the selected row"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        height = self.sprite_canvas.cell_height
-        
-        # Create new image with extra row
-        new_height = img.size[1] + height
-        new_img = Image.new('RGBA', (img.size[0], new_height), (0, 0, 0, 0))
-        
-        # Copy parts before and after the insertion point
-        if row > 0:
-            new_img.paste(img.crop((0, 0, img.size[0], row * height)), (0, 0))
-        new_img.paste(img.crop((0, row * height, img.size[0], img.size[1])), 
-                     (0, (row + 1) * height))
+        row = canvas.selection_start_cell()[1]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'insert_before', row, canvas.cell_height))
         self.statusBar().showMessage(f"Added blank row before row {row}")
 
     def add_row_after(self):
         """Add a blank row after the selected row"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        height = self.sprite_canvas.cell_height
-        
-        # Create new image with extra row
-        new_height = img.size[1] + height
-        new_img = Image.new('RGBA', (img.size[0], new_height), (0, 0, 0, 0))
-        
-        # Copy parts before and after the insertion point
-        new_img.paste(img.crop((0, 0, img.size[0], (row + 1) * height)), (0, 0))
-        if row < (img.size[1] // height - 1):
-            new_img.paste(img.crop((0, (row + 1) * height, img.size[0], img.size[1])), 
-                         ((row + 2) * height))
+        row = canvas.selection_start_cell()[1]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'insert_after', row, canvas.cell_height))
         self.statusBar().showMessage(f"Added blank row after row {row}")
 
     def export_row(self):
         """Export the selected row as a new sprite sheet"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        height = self.sprite_canvas.cell_height
-        
-        # Extract the row
-        row_img = img.crop((0, row * height, img.size[0], (row + 1) * height))
+        row = canvas.selection_start_cell()[1]
         
         # Get save filename
         filename, _ = QFileDialog.getSaveFileName(self, "Save Row",
                                                 "", "PNG Files (*.png);;All Files (*)")
         if filename:
-            row_img.save(filename)
+            # Encode the row straight from a slice of the RGBA buffer
+            row_pixels = canvas.get_strip(row)
+            Image.fromarray(row_pixels).save(filename, compress_level=canvas.png_compress_level)
             self.statusBar().showMessage(f"Row exported to {filename}")
 
     def duplicate_column(self):
         """Duplicate the selected column"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        
-        # Create new image with extra column
-        new_width = img.size[0] + width
-        new_img = Image.new('RGBA', (new_width, img.size[1]), (0, 0, 0, 0))
-        
-        # Copy original image
-        new_img.paste(img, (0, 0))
-        
-        # Copy selected column to new position
-        col_img = img.crop((col * width, 0, (col + 1) * width, img.size[1]))
-        new_img.paste(col_img, (img.size[0], 0))
+        col = canvas.selection_start_cell()[0]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'duplicate', col, canvas.cell_width, axis=1))
         self.statusBar().showMessage(f"Duplicated column {col}")
 
     def delete_column(self):
         """Delete the selected column"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        
-        # Create new image without the selected column
-        new_width = img.size[0] - width
-        new_height = img.size[1]
-        new_img = Image.new('RGBA', (new_width, new_height), (0, 0, 0, 0))
-        
-        # Copy parts before and after the selected column
-        if col > 0:
-            new_img.paste(img.crop((0, 0, col * width, img.size[1])), (0, 0))
-        if col < (img.size[0] // width - 1):
-            new_img.paste(img.crop(((col + 1) * width, 0, img.size[0], img.size[1])), 
-                         (col * width, 0))
+        col = canvas.selection_start_cell()[0]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'delete', col, canvas.cell_width, axis=1))
         self.statusBar().showMessage(f"Deleted column {col}")
 
     def add_column_before(self):
         """Add a blank column before the selected column"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        
-        # Create new image with extra column
-        new_width = img.size[0] + width
-        new_img = Image.new('RGBA', (new_width, img.size[1]), (0, 0, 0, 0))
-        
-        # Copy parts before and after the insertion point
-        if col > 0:
-            new_img.paste(img.crop((0, 0, col * width, img.size[1])), (0, 0))
-        new_img.paste(img.crop((col * width, 0, img.size[0], img.size[1])), 
-                     ((col + 1) * width, 0))
+        col = canvas.selection_start_cell()[0]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'insert_before', col, canvas.cell_width, axis=1))
         self.statusBar().showMessage(f"Added blank column before column {col}")
 
     def add_column_after(self):
         """Add a blank column after the selected column"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        
-        # Create new image with extra column
-        new_width = img.size[0] + width
-        new_img = Image.new('RGBA', (new_width, img.size[1]), (0, 0, 0, 0))
-        
-        # Copy parts before and after the insertion point
-        new_img.paste(img.crop((0, 0, (col + 1) * width, img.size[1])), (0, 0))
-        if col < (img.size[0] // width - 1):
-            new_img.paste(img.crop(((col + 1) * width, 0, img.size[0], img.size[1])), 
-                         ((col + 2) * width, 0))
+        col = canvas.selection_start_cell()[0]
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'insert_after', col, canvas.cell_width, axis=1))
         self.statusBar().showMessage(f"Added blank column after column {col}")
 
     def export_column(self):
         """Export the selected column as a new sprite sheet"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        
-        # Extract the column
-        col_img = img.crop((col * width, 0, (col + 1) * width, img.size[1]))
+        col = canvas.selection_start_cell()[0]
         
         # Get save filename
         filename, _ = QFileDialog.getSaveFileName(self, "Save Column",
                                                 "", "PNG Files (*.png);;All Files (*)")
         if filename:
-            col_img.save(filename)
+            # Encode the column straight from a slice of the RGBA buffer
+            col_pixels = canvas.get_strip(col, axis=1)
+            Image.fromarray(col_pixels).save(filename, compress_level=canvas.png_compress_level)
             self.statusBar().showMessage(f"Column exported to {filename}")
 
     def duplicate_frame(self):
         """Duplicate the selected frame"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        height = self.sprite_canvas.cell_height
+        col, row = canvas.selection_start_cell()
+        src = canvas.spritesheet
+        width = canvas.cell_width
+        height = canvas.cell_height
+        src_height, src_width = src.shape[:2]
         
         # Extract the frame
-        frame = img.crop((col * width, row * height, (col + 1) * width, (row + 1) * height))
+        frame = src[row * height:(row + 1) * height, col * width:(col + 1) * width]
         
-        # Create new image with space for the duplicated frame
-        new_width = img.size[0] + width
-        new_img = Image.new('RGBA', (new_width, img.size[1]), (0, 0, 0, 0))
+        # Create new sheet with space for the duplicated frame
+        new_sheet = np.empty((src_height, src_width + width, 4), dtype=np.uint8)
         
         # Copy original image
-        new_img.paste(img, (0, 0))
+        new_sheet[:, :src_width] = src
         
-        # Add duplicated frame at the end of the row
-        new_img.paste(frame, (img.size[0], row * height))
+        # Add duplicated frame at the end of the row; only the rest of the new column is blank
+        new_sheet[:, src_width:] = 0
+        new_sheet[row * height:row * height + frame.shape[0],
+                  src_width:src_width + frame.shape[1]] = frame
         
         # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        canvas.set_spritesheet(new_sheet)
         self.statusBar().showMessage(f"Duplicated frame at ({col}, {row})")
 
     def delete_frame(self):
         """Delete the selected frame"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        height = self.sprite_canvas.cell_height
+        col, row = canvas.selection_start_cell()
         
-        # Create new image without the selected frame
-        new_width = img.size[0] - width
-        new_img = Image.new('RGBA', (new_width, img.size[1]), (0, 0, 0, 0))
-        
-        # Copy all frames except the selected one
-        if col > 0:
-            new_img.paste(img.crop((0, 0, col * width, img.size[1])), (0, 0))
-        if col < (img.size[0] // width - 1):
-            new_img.paste(img.crop(((col + 1) * width, 0, img.size[0], img.size[1])), 
-                         (col * width, 0))
-        
-        # Update the sprite image
-        self.sprite_canvas.sprite_image = new_img
-        self.sprite_canvas.update_pixmap()
+        # Frames are removed together with the rest of their column
+        canvas.set_spritesheet(edit_sheet(
+            canvas.spritesheet, 'delete', col, canvas.cell_width, axis=1))
         self.statusBar().showMessage(f"Deleted frame at ({col}, {row})")
 
     def export_frame(self):
         """Export the selected frame as an individual image file"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
+        canvas = self.sprite_canvas
+        if canvas.spritesheet is None or not canvas.selection_start:
             return
             
-        col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        img = self.sprite_canvas.sprite_image
-        width = self.sprite_canvas.cell_width
-        height = self.sprite_canvas.cell_height
-        
-        # Extract the frame
-        frame = img.crop((col * width, row * height, (col + 1) * width, (row + 1) * height))
+        col, row = canvas.selection_start_cell()
         
         # Get save filename
         filename, _ = QFileDialog.getSaveFileName(self, "Save Frame",
                                                 "", "PNG Files (*.png);;All Files (*)")
         if filename:
-            frame.save(filename)
+            # Slice the frame from the RGBA buffer; an edge cell comes back zero-padded
+            frame = canvas.get_frames([(col, row)])[0]
+            Image.fromarray(frame).save(filename, compress_level=canvas.png_compress_level)
             self.statusBar().showMessage(f"Frame exported to {filename}")
 
     def zoom_in(self):
@@ -1699,34 +2017,40 @@ class SpriteToolz(QMainWindow):
 
     def update_button_states(self):
         """Update the enabled/disabled state of manipulation buttons based on selection"""
-        has_image = self.sprite_canvas.sprite_image is not None
+        has_image = self.sprite_canvas.spritesheet is not None
         has_selection = self.sprite_canvas.selection_start is not None and self.sprite_canvas.selection_end is not None
         
-        # Find all manipulation buttons and update their states
-        for group in self.findChildren(QGroupBox):
-            if group.title() in ["Row Operations", "Column Operations", "Frame Operations"]:
-                for button in group.findChildren(QPushButton):
-                    button.setEnabled(has_image and has_selection)
+        # Leave the buttons alone unless the state actually changed
+        state = (has_image, has_selection)
+        if state == self._last_manip_state:
+            return
+        self._last_manip_state = state
+        
+        # Update the cached manipulation buttons
+        enabled = has_image and has_selection
+        for button in self._manip_buttons:
+            button.setEnabled(enabled)
 
     def update_selection_label(self):
         """Update the selection info label"""
-        if not self.sprite_canvas.sprite_image or not self.sprite_canvas.selection_start:
-            self.selection_label.setText("No selection")
-            return
-            
-        start_row = self.sprite_canvas.selection_start[1] // self.sprite_canvas.cell_height
-        end_row = self.sprite_canvas.selection_end[1] // self.sprite_canvas.cell_height
-        start_col = self.sprite_canvas.selection_start[0] // self.sprite_canvas.cell_width
-        end_col = self.sprite_canvas.selection_end[0] // self.sprite_canvas.cell_width
-        
-        if start_row == end_row and start_col == end_col:
-            self.selection_label.setText(f"Selected frame: ({start_col}, {start_row})")
-        elif start_row == end_row:
-            self.selection_label.setText(f"Selected row: {start_row}")
-        elif start_col == end_col:
-            self.selection_label.setText(f"Selected column: {start_col}")
+        if self.sprite_canvas.spritesheet is None or not self.sprite_canvas.selection_start:
+            text = "No selection"
         else:
-            self.selection_label.setText(f"Selected area: ({start_col}, {start_row}) to ({end_col}, {end_row})")
+            start_col, start_row = self.sprite_canvas.selection_start
+            end_col, end_row = self.sprite_canvas.selection_end
+            
+            if start_row == end_row and start_col == end_col:
+                text = f"Selected frame: ({start_col}, {start_row})"
+            elif start_row == end_row:
+                text = f"Selected row: {start_row}"
+            elif start_col == end_col:
+                text = f"Selected column: {start_col}"
+            else:
+                text = f"Selected area: ({start_col}, {start_row}) to ({end_col}, {end_row})"
+        
+        # Skip the relayout when the label already shows this text
+        if text != self.selection_label.text():
+            self.selection_label.setText(text)
 
     def select_input_folder(self):
         """Open folder selection dialog for batch processing"""
@@ -1739,23 +2063,29 @@ class SpriteToolz(QMainWindow):
         
         if folder:
             self.input_folder_label.setText(folder)
-            self.process_batch_btn.setEnabled(True)
+            # A running batch re-enables the button itself when it finishes
+            self.process_batch_btn.setEnabled(not self._batch_running)
             self.statusBar().showMessage(f"Selected folder: {folder}")
             
     def process_batch(self):
         """Process all sprite sheets in the selected folder"""
         input_folder = self.input_folder_label.text()
-        if input_folder == "No folder selected":
+        if input_folder == "No folder selected" or self._batch_running:
             return
             
         # Get processing options
-        cell_width = self.batch_cell_width_spin.value()
-        cell_height = self.batch_cell_height_spin.value()
-        padding = self.batch_padding_spin.value()
-        export_frames = self.export_frames_cb.isChecked()
-        export_rows = self.export_rows_cb.isChecked()
-        export_gif = self.export_gif_cb.isChecked()
-        export_apng = self.export_apng_cb.isChecked()
+        options = {
+            'cell_width': self.batch_cell_width_spin.value(),
+            'cell_height': self.batch_cell_height_spin.value(),
+            'padding': self.batch_padding_spin.value(),
+            'export_frames': self.export_frames_cb.isChecked(),
+            'export_rows': self.export_rows_cb.isChecked(),
+            'export_gif': self.export_gif_cb.isChecked(),
+            'export_apng': self.export_apng_cb.isChecked(),
+            'apng_per_sheet': self.apng_per_sheet_cb.isChecked(),
+            'png_compress_level': (PNG_FAST_COMPRESS_LEVEL if self.batch_fast_png_cb.isChecked()
+                                   else PNG_DEFAULT_COMPRESS_LEVEL),
+        }
         include_subfolders = self.include_subfolders_cb.isChecked()
         
         # Create output folder
@@ -1763,167 +2093,47 @@ class SpriteToolz(QMainWindow):
         os.makedirs(output_folder, exist_ok=True)
         
         # Get list of files to process
-        if include_subfolders:
-            sprite_files = []
-            for root, _, files in os.walk(input_folder):
-                for file in files:
-                    if file.lower().endswith(('.png', '.jpg', '.bmp', '.gif')):
-                        sprite_files.append(os.path.join(root, file))
-        else:
-            sprite_files = [
-                os.path.join(input_folder, f) for f in os.listdir(input_folder)
-                if f.lower().endswith(('.png', '.jpg', '.bmp', '.gif'))
-            ]
+        sprite_files = list(iter_sprite_files(input_folder, include_subfolders))
         
         if not sprite_files:
             self.batch_progress_label.setText("No sprite sheets found")
             return
             
-        # Process each file
-        total_files = len(sprite_files)
-        for i, file_path in enumerate(sprite_files, 1):
-            self.batch_progress_label.setText(f"Processing {i}/{total_files}: {os.path.basename(file_path)}")
-            self.statusBar().showMessage(f"Processing {os.path.basename(file_path)}")
-            QApplication.processEvents()  # Update UI
+        # Hand every file to the thread pool; results come back through signals
+        self._batch_total = len(sprite_files)
+        self._batch_done = 0
+        self._batch_signals = BatchSignals()
+        self._batch_signals.finished.connect(self.batch_file_finished)
+        self._batch_running = True
+        self.process_batch_btn.setEnabled(False)
+        self.batch_progress_label.setText(f"Processing 0/{self._batch_total}")
+        
+        # Outputs are named after the file stem, so sheets like a.png and a.gif
+        # share one job and are written in order rather than at the same time
+        jobs = {}
+        for file_path in sprite_files:
+            stem = os.path.normcase(os.path.splitext(file_path)[0])
+            jobs.setdefault(stem, []).append(file_path)
+            
+        pool = QThreadPool.globalInstance()
+        for file_paths in jobs.values():
+            pool.start(BatchJob(file_paths, input_folder, output_folder, options, self._batch_signals))
+            
+    def batch_file_finished(self, file_path, error_msg):
+        """Track batch progress as each worker reports back"""
+        self._batch_done += 1
+        if error_msg:
+            self.statusBar().showMessage(error_msg)
+            self.batch_progress_label.setText(error_msg)
+        else:
+            self.batch_progress_label.setText(
+                f"Processed {self._batch_done}/{self._batch_total}: {os.path.basename(file_path)}")
             
-            try:
-                # Load sprite sheet
-                img = Image.open(file_path)
-                
-                # Apply padding if needed
-                if padding > 0:
-                    # Calculate cells
-                    cols = img.size[0] // cell_width
-                    rows = img.size[1] // cell_height
-                    
-                    # Create padded image
-                    padded_width = cols * (cell_width + 2 * padding)
-                    padded_height = rows * (cell_height + 2 * padding)
-                    padded_img = Image.new(img.mode, (padded_width, padded_height), (0, 0, 0, 0))
-                    
-                    # Copy cells with padding
-                    for row in range(rows):
-                        for col in range(cols):
-                            src_x = col * cell_width
-                            src_y = row * cell_height
-                            dst_x = col * (cell_width + 2 * padding) + padding
-                            dst_y = row * (cell_height + 2 * padding) + padding
-                            
-                            cell = img.crop(
-                                (src_x, src_y, src_x + cell_width, src_y + cell_height)
-                            )
-                            padded_img.paste(cell, (dst_x, dst_y))
-                            
-                    img = padded_img
-                    cell_width += 2 * padding
-                    cell_height += 2 * padding
-                
-                # Create output subfolder matching input structure
-                rel_path = os.path.relpath(os.path.dirname(file_path), input_folder)
-                curr_output_folder = os.path.join(output_folder, rel_path)
-                os.makedirs(curr_output_folder, exist_ok=True)
-                
-                base_name = os.path.splitext(os.path.basename(file_path))[0]
-                
-                # Export individual frames if requested
-                if export_frames:
-                    frames_folder = os.path.join(curr_output_folder, f"{base_name}_frames")
-                    os.makedirs(frames_folder, exist_ok=True)
-                    
-                    cols = img.size[0] // cell_width
-                    rows = img.size[1] // cell_height
-                    frame_count = 0
-                    
-                    for row in range(rows):
-                        for col in range(cols):
-                            frame = img.crop(
-                                (col * cell_width, row * cell_height,
-                                 (col + 1) * cell_width, (row + 1) * cell_height))
-                            frame.save(os.path.join(frames_folder, f"frame_{frame_count:03d}.png"))
-                            frame_count += 1
-                
-                # Export rows if requested
-                if export_rows or export_gif or export_apng:
-                    rows_folder = os.path.join(curr_output_folder, f"{base_name}_rows")
-                    os.makedirs(rows_folder, exist_ok=True)
-                    
-                    rows = img.size[1] // cell_height
-                    cols = img.size[0] // cell_width
-                    
-                    for row in range(rows):
-                        # Export row as strip if requested
-                        if export_rows:
-                            row_img = img.crop(
-                                (0, row * cell_height,
-                                 img.size[0], (row + 1) * cell_height))
-                            row_img.save(os.path.join(rows_folder, f"row_{row:03d}.png"))
-                        
-                        # Export as GIF if requested
-                        if export_gif:
-                            frames = []
-                            for col in range(cols):
-                                frame = img.crop(
-                                    (col * cell_width, row * cell_height,
-                                     (col + 1) * cell_width, (row + 1) * cell_height))
-                                # Convert frame to RGBA if it isn't already
-                                if frame.mode != 'RGBA':
-                                    frame = frame.convert('RGBA')
-                                frames.append(frame)
-                            
-                            if frames:
-                                try:
-                                    gif_path = os.path.join(rows_folder, f"row_{row:03d}.gif")
-                                    frames[0].save(
-                                        gif_path,
-                                        format='GIF',
-                                        append_images=frames[1:],
-                                        save_all=True,
-                                        duration=100,
-                                        loop=0,
-                                        transparency=0,
-                                        disposal=2  # Clear previous frame
-                                    )
-                                    self.statusBar().showMessage(f"Created GIF: {os.path.basename(gif_path)}")
-                                except Exception as e:
-                                    self.statusBar().showMessage(f"Error creating GIF for row {row}: {str(e)}")
-                        
-                        # Export as APNG if requested
-                        if export_apng:
-                            frames = []
-                            for col in range(cols):
-                                frame = img.crop(
-                                    (col * cell_width, row * cell_height,
-                                     (col + 1) * cell_width, (row + 1) * cell_height))
-                                # Convert frame to RGBA if it isn't already
-                                if frame.mode != 'RGBA':
-                                    frame = frame.convert('RGBA')
-                                frames.append(np.array(frame))
-                            
-                            if frames:
-                                try:
-                                    apng_path = os.path.join(rows_folder, f"row_{row:03d}.png")
-                                    # Save as animated PNG with proper animation settings
-                                    imageio.mimsave(
-                                        apng_path,
-                                        frames,
-                                        format='APNG',
-                                        fps=10,  # 10 frames per second
-                                        loop=0,  # Loop forever
-                                        duration=100  # 100ms per frame
-                                    )
-                                    self.statusBar().showMessage(f"Created animated PNG for row {row}")
-                                except Exception as e:
-                                    self.statusBar().showMessage(f"Error creating animated PNG for row {row}: {str(e)}")
-                                    continue
-                
-            except Exception as e:
-                error_msg = f"Error processing {os.path.basename(file_path)}: {str(e)}"
-                self.statusBar().showMessage(error_msg)
-                self.batch_progress_label.setText(error_msg)
-                continue
-        
-        self.batch_progress_label.setText("Processing complete")
-        self.statusBar().showMessage("Batch processing complete")
+        if self._batch_done == self._batch_total:
+            self._batch_running = False
+            self.process_batch_btn.setEnabled(True)
+            self.batch_progress_label.setText("Processing complete")
+            self.statusBar().showMessage("Batch processing complete")
 
 
 def main():
@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from sprite_toolz import edit_sheet
+
+
+def make_sheet(height, width):
+    return np.arange(height * width * 4, dtype=np.uint8).reshape(height, width, 4)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+@pytest.mark.parametrize("op", ["insert_before", "insert_after", "duplicate", "delete"])
+def test_index_past_sheet_end(op, axis):
+    # A stale selection can point at a cell beyond the sheet, e.g. after the
+    # cell size grew or a strip was deleted
+    sheet = make_sheet(64, 48)
+    size = 64
+    result = edit_sheet(sheet, op, 2, size, axis=axis)
+    
+    length = sheet.shape[axis]
+    if op == "delete":
+        if length < size:
+            assert result is sheet
+        else:
+            assert result.shape[axis] == length - size
+    else:
+        assert result.shape[axis] == length + size
+        kept = np.take(result, np.arange(length), axis=axis)
+        np.testing.assert_array_equal(kept, sheet)
+        assert not np.take(result, np.arange(length, length + size), axis=axis).any()
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_insert_before_inside_sheet(axis):
+    sheet = make_sheet(64, 64)
+    result = edit_sheet(sheet, "insert_before", 1, 32, axis=axis)
+    
+    np.testing.assert_array_equal(np.take(result, np.arange(32), axis=axis),
+                                  np.take(sheet, np.arange(32), axis=axis))
+    assert not np.take(result, np.arange(32, 64), axis=axis).any()
+    np.testing.assert_array_equal(np.take(result, np.arange(64, 96), axis=axis),
+                                  np.take(sheet, np.arange(32, 64), axis=axis))